@@ -8,69 +8,179 @@ const STORAGE_KEYS = {
     ENTRIES: 'doscroll:entries'
 };
 
+// Parsed copies of localStorage values (undefined = not loaded yet).
+// localStorage is always written first, so a failed write (e.g. quota
+// exceeded) leaves the cache matching what is actually stored.
+const storageCache = {
+    token: undefined,
+    active: undefined,
+    activeJson: undefined,
+    entries: undefined,
+    entriesJson: undefined,
+    totals: undefined
+};
+
+// Completed time entries are stored as compact [t, s, e] tuples
+function encodeEntry(entry) {
+    return [entry.t, entry.s, entry.e];
+}
+
+function decodeEntry(row) {
+    // Older saves used {t, s, e} objects
+    return Array.isArray(row) ? { t: row[0], s: row[1], e: row[2] } : row;
+}
+
 const Storage = {
     getToken() {
-        return localStorage.getItem(STORAGE_KEYS.TOKEN);
+        if (storageCache.token === undefined) {
+            storageCache.token = localStorage.getItem(STORAGE_KEYS.TOKEN);
+        }
+        return storageCache.token;
     },
 
     setToken(token) {
         localStorage.setItem(STORAGE_KEYS.TOKEN, token);
+        storageCache.token = token;
     },
 
     getActive() {
-        const data = localStorage.getItem(STORAGE_KEYS.ACTIVE);
-        return data ? JSON.parse(data) : null;
+        if (storageCache.active === undefined) {
+            const data = localStorage.getItem(STORAGE_KEYS.ACTIVE);
+            storageCache.active = data ? JSON.parse(data) : null;
+            storageCache.activeJson = data;
+        }
+        return storageCache.active;
     },
 
     setActive(entry) {
-        if (entry === null) {
+        const data = entry === null ? null : JSON.stringify(entry);
+
+        // Skip the write if the stored value would not change
+        this.revalidate(STORAGE_KEYS.ACTIVE);
+        this.getActive();
+        if (data === storageCache.activeJson) return;
+
+        if (data === null) {
             localStorage.removeItem(STORAGE_KEYS.ACTIVE);
         } else {
-            localStorage.setItem(STORAGE_KEYS.ACTIVE, JSON.stringify(entry));
+            localStorage.setItem(STORAGE_KEYS.ACTIVE, data);
         }
+        storageCache.active = entry;
+        storageCache.activeJson = data;
     },
 
     getEntries() {
-        const data = localStorage.getItem(STORAGE_KEYS.ENTRIES);
-        return data ? JSON.parse(data) : [];
+        if (storageCache.entries === undefined) {
+            const data = localStorage.getItem(STORAGE_KEYS.ENTRIES) || '[]';
+            const rows = JSON.parse(data);
+            storageCache.entries = rows.map(decodeEntry);
+            storageCache.entriesJson = data;
+
+            // Rewrite entries saved in the older object format
+            if (rows.some(row => !Array.isArray(row))) {
+                this.saveEntries(storageCache.entries);
+            }
+        }
+        return storageCache.entries;
     },
 
     saveEntries(entries) {
-        localStorage.setItem(STORAGE_KEYS.ENTRIES, JSON.stringify(entries));
+        const data = JSON.stringify(entries.map(encodeEntry));
+        localStorage.setItem(STORAGE_KEYS.ENTRIES, data);
+        storageCache.entries = entries;
+        storageCache.entriesJson = data;
+        storageCache.totals = undefined;
+    },
+
+    // Drop cached values so the next read goes back to localStorage
+    invalidate(key = null) {
+        if (key === null || key === STORAGE_KEYS.TOKEN) {
+            storageCache.token = undefined;
+        }
+        if (key === null || key === STORAGE_KEYS.ACTIVE) {
+            storageCache.active = undefined;
+            storageCache.activeJson = undefined;
+        }
+        if (key === null || key === STORAGE_KEYS.ENTRIES) {
+            storageCache.entries = undefined;
+            storageCache.entriesJson = undefined;
+            storageCache.totals = undefined;
+        }
+    },
+
+    // Drop cached values that no longer match localStorage, e.g. after a
+    // storage event was missed. Compares raw strings, so it is cheap.
+    revalidate(key = null) {
+        if ((key === null || key === STORAGE_KEYS.ACTIVE)
+            && storageCache.active !== undefined
+            && localStorage.getItem(STORAGE_KEYS.ACTIVE) !== storageCache.activeJson) {
+            this.invalidate(STORAGE_KEYS.ACTIVE);
+        }
+        if ((key === null || key === STORAGE_KEYS.ENTRIES)
+            && storageCache.entries !== undefined
+            && (localStorage.getItem(STORAGE_KEYS.ENTRIES) || '[]') !== storageCache.entriesJson) {
+            this.invalidate(STORAGE_KEYS.ENTRIES);
+        }
     },
 
     addEntry(entry) {
+        // Never write back a list another tab has changed since we read it
+        this.revalidate(STORAGE_KEYS.ENTRIES);
         const entries = this.getEntries();
+
+        // Splice the new entry into the stored JSON instead of re-encoding all entries
+        const prev = storageCache.entriesJson;
+        if (entries.length > 0 && !prev.endsWith(']')) {
+            // Stored text has trailing characters (e.g. edited by hand) - rewrite it whole
+            this.saveEntries([...entries, entry]);
+            return;
+        }
+        const data = entries.length === 0
+            ? `[${JSON.stringify(encodeEntry(entry))}]`
+            : `${prev.slice(0, -1)},${JSON.stringify(encodeEntry(entry))}]`;
+        localStorage.setItem(STORAGE_KEYS.ENTRIES, data);
+
         entries.push(entry);
-        this.saveEntries(entries);
+        storageCache.entriesJson = data;
+
+        // Keep cached totals current rather than re-summing every entry
+        const totals = storageCache.totals;
+        if (totals !== undefined) {
+            totals.set(entry.t, (totals.get(entry.t) || 0) + entry.e - entry.s);
+        }
+    },
+
+    // Completed seconds per task ID, summed once per load of the entries
+    getCompletedTotals() {
+        if (storageCache.totals === undefined) {
+            const totals = new Map();
+            for (const entry of this.getEntries()) {
+                totals.set(entry.t, (totals.get(entry.t) || 0) + entry.e - entry.s);
+            }
+            storageCache.totals = totals;
+        }
+        return storageCache.totals;
     },
 
     // Calculate duration in seconds from timestamps
-    calculateDuration(startTs, endTs) {
+    calculateDuration(startTs, endTs, nowTs = nowSeconds()) {
         if (!endTs) {
             // Active session - calculate current duration
-            return Math.floor((Date.now() / 1000) - startTs);
+            return nowTs - startTs;
         }
         return endTs - startTs;
     },
 
-    // Get total time for a task ID
-    getTotalTimeForTask(taskId) {
-        const entries = this.getEntries();
+    // Get total time for a task ID (pass nowTs to share one clock reading across calls)
+    getTotalTimeForTask(taskId, nowTs = nowSeconds()) {
         const active = this.getActive();
 
-        let total = 0;
-
-        // Sum completed entries
-        for (const entry of entries) {
-            if (entry.t === taskId) {
-                total += entry.e - entry.s;
-            }
-        }
+        // Completed entries
+        let total = this.getCompletedTotals().get(taskId) || 0;
 
         // Add active entry if it's this task
         if (active && active.t === taskId) {
-            total += this.calculateDuration(active.s, null);
+            total += this.calculateDuration(active.s, null, nowTs);
         }
 
         return total;
@@ -81,15 +191,28 @@ const Storage = {
 
 const Todoist = {
     BASE_URL: 'https://api.todoist.com/rest/v2',
+    CACHE_TTL_MS: 5000,
+    responseCache: new Map(),
+    baseHeaders: null,
+    baseHeadersToken: null,
 
-    async request(endpoint, options = {}) {
+    // Headers shared by every request, rebuilt only when the token changes
+    getBaseHeaders() {
         const token = Storage.getToken();
+        if (this.baseHeaders === null || this.baseHeadersToken !== token) {
+            this.baseHeaders = {
+                'Content-Type': 'application/json',
+                'Authorization': `Bearer ${token}`
+            };
+            this.baseHeadersToken = token;
+        }
+        return this.baseHeaders;
+    },
+
+    async request(endpoint, options = {}) {
         const url = `${this.BASE_URL}${endpoint}`;
-        const headers = {
-            'Content-Type': 'application/json',
-            'Authorization': `Bearer ${token}`,
-            ...options.headers
-        };
+        const baseHeaders = this.getBaseHeaders();
+        const headers = options.headers ? { ...baseHeaders, ...options.headers } : baseHeaders;
 
         try {
             const response = await fetch(url, { ...options, headers });
@@ -106,16 +229,39 @@ const Todoist = {
         }
     },
 
-    async getTasks(filter = null) {
+    // GET with a short-lived cache; concurrent callers share one request
+    cachedGet(endpoint, fresh = false) {
+        const cached = this.responseCache.get(endpoint);
+        if (!fresh && cached && cached.expires > Date.now()) {
+            return cached.promise;
+        }
+
+        const promise = this.request(endpoint);
+        const entry = { promise, expires: Date.now() + this.CACHE_TTL_MS };
+        this.responseCache.set(endpoint, entry);
+
+        // Don't keep failed responses around
+        promise.catch(() => {
+            if (this.responseCache.get(endpoint) === entry) {
+                this.responseCache.delete(endpoint);
+            }
+        });
+        return promise;
+    },
+
+    async getTasks(filter = null, fresh = false) {
         let url = '/tasks';
         if (filter) {
             url += `?filter=${encodeURIComponent(filter)}`;
         }
-        return this.request(url);
+        return this.cachedGet(url, fresh);
     },
 
     async closeTask(taskId) {
-        return this.request(`/tasks/${taskId}/close`, { method: 'POST' });
+        const result = await this.request(`/tasks/${taskId}/close`, { method: 'POST' });
+        // Task lists have changed
+        this.responseCache.clear();
+        return result;
     },
 
     async addComment(taskId, content) {
@@ -131,6 +277,7 @@ const Todoist = {
 const state = {
     taskList: [],
     doneTaskList: [],
+    taskIndex: new Map(),
     currentIndex: 0,
     viewingDone: false,
     activeTaskId: null
@@ -139,18 +286,35 @@ const state = {
 // ===== TASK MANAGEMENT =====
 
 const TaskManager = {
-    async syncTasks() {
+    // Task array the current lists were built from
+    lastSyncedTasks: null,
+
+    async syncTasks(fresh = false) {
         try {
-            const tasks = await Todoist.getTasks();
-            // Filter into incomplete and completed
-            state.taskList = tasks.filter(t => !t.is_completed);
-            state.doneTaskList = tasks.filter(t => t.is_completed);
-            // Sort completed by newest first
-            state.doneTaskList.sort((a, b) => {
-                const aTime = b.completed_at ? new Date(b.completed_at).getTime() : 0;
-                const bTime = a.completed_at ? new Date(a.completed_at).getTime() : 0;
-                return aTime - bTime;
-            });
+            const tasks = await Todoist.getTasks(null, fresh);
+            // Cached response - lists are already built from it
+            if (tasks === this.lastSyncedTasks) {
+                return true;
+            }
+            this.lastSyncedTasks = tasks;
+
+            // Split into incomplete and completed, indexing by ID, in one pass
+            const taskList = [];
+            const doneTaskList = [];
+            const taskIndex = new Map();
+            for (const task of tasks) {
+                (task.is_completed ? doneTaskList : taskList).push(task);
+                taskIndex.set(task.id, task);
+            }
+            state.taskList = taskList;
+            state.doneTaskList = doneTaskList;
+            state.taskIndex = taskIndex;
+            // Sort completed by newest first, parsing each timestamp once
+            const completedTimes = new Map(state.doneTaskList.map(t => [
+                t,
+                t.completed_at ? Date.parse(t.completed_at) : 0
+            ]));
+            state.doneTaskList.sort((a, b) => completedTimes.get(b) - completedTimes.get(a));
             return true;
         } catch (error) {
             console.error('Sync failed:', error);
@@ -162,14 +326,15 @@ const TaskManager = {
         // First sync to get latest data
         await this.syncTasks();
 
-        // Check if a task is already active
+        // Check if a task is already active (possibly started in another tab)
+        Storage.revalidate(STORAGE_KEYS.ACTIVE);
         const active = Storage.getActive();
         if (active) {
             throw new Error('A task is already active');
         }
 
         // Start the timer
-        const now = Math.floor(Date.now() / 1000);
+        const now = nowSeconds();
         const entry = { t: taskId, s: now };
         Storage.setActive(entry);
         state.activeTaskId = taskId;
@@ -178,13 +343,14 @@ const TaskManager = {
     },
 
     stopWork(taskId) {
+        Storage.revalidate(STORAGE_KEYS.ACTIVE);
         const active = Storage.getActive();
         if (!active || active.t !== taskId) {
             throw new Error('This task is not active');
         }
 
         // Calculate end time
-        const endTs = Math.floor(Date.now() / 1000);
+        const endTs = nowSeconds();
         const entry = { ...active, e: endTs };
 
         // Save as completed entry
@@ -207,29 +373,30 @@ const TaskManager = {
         // Mark complete on Todoist
         await Todoist.closeTask(taskId);
 
-        // Add comment with total time spent
+        // Refresh tasks and add the total-time comment concurrently
+        const requests = [this.syncTasks()];
+
         const totalSeconds = Storage.getTotalTimeForTask(taskId);
         if (totalSeconds > 0) {
             const formattedTime = formatTime(totalSeconds);
-            try {
-                await Todoist.addComment(taskId, `Total time: ${formattedTime}`);
-            } catch (error) {
-                // Comment is optional, don't fail if it doesn't work
-                console.error('Failed to add comment:', error);
-            }
+            requests.push(
+                Todoist.addComment(taskId, `Total time: ${formattedTime}`).catch(error => {
+                    // Comment is optional, don't fail if it doesn't work
+                    console.error('Failed to add comment:', error);
+                })
+            );
         }
 
-        // Refresh tasks
-        await this.syncTasks();
+        await Promise.all(requests);
     },
 
     getActiveTaskSummary() {
         const active = Storage.getActive();
         if (!active) return null;
 
-        // Find task in list
-        const task = state.taskList.find(t => t.id === active.t);
-        if (!task) return null;
+        // Find task in incomplete list
+        const task = state.taskIndex.get(active.t);
+        if (!task || task.is_completed) return null;
 
         const duration = Storage.calculateDuration(active.s, null);
 
@@ -245,17 +412,24 @@ const TaskManager = {
 
     getTaskSummary(taskId) {
         const entries = Storage.getEntries();
-        const taskEntries = entries.filter(e => e.t === taskId);
         const active = Storage.getActive();
 
-        const totalSeconds = Storage.getTotalTimeForTask(taskId);
+        // Collect this task's entries and their total in a single pass
+        const taskEntries = [];
+        let completedSeconds = 0;
+        for (const entry of entries) {
+            if (entry.t === taskId) {
+                taskEntries.push(entry);
+                completedSeconds += entry.e - entry.s;
+            }
+        }
 
-        const isActive = active && active.t === taskId;
+        const isActive = active !== null && active.t === taskId;
         const currentDuration = isActive ? Storage.calculateDuration(active.s, null) : 0;
 
         return {
-            task: { id: taskId },
-            total_time_seconds: totalSeconds,
+            task: state.taskIndex.get(taskId) || { id: taskId },
+            total_time_seconds: completedSeconds + currentDuration,
             total_time_entries: taskEntries.length + (isActive ? 1 : 0),
             is_active: isActive,
             current_session_duration: currentDuration,
@@ -328,11 +502,31 @@ async function fetchTaskTime(taskId) {
     return { task_id: taskId, total_seconds: totalSeconds };
 }
 
-async function syncTasks() {
-    const success = await TaskManager.syncTasks();
+async function syncTasks(fresh = false) {
+    const success = await TaskManager.syncTasks(fresh);
     return { synced: success, task_count: state.taskList.length };
 }
 
+// ===== DOM ELEMENTS =====
+
+// Looked up once on load instead of on every render
+const elements = {};
+
+function cacheElements() {
+    elements.title = document.getElementById('task-title');
+    elements.description = document.getElementById('task-description');
+    elements.meta = document.getElementById('task-meta');
+    elements.time = document.getElementById('task-time');
+    elements.toggle = document.getElementById('btn-toggle');
+    elements.toggleIcon = elements.toggle.querySelector('i');
+    elements.previous = document.getElementById('btn-previous');
+    elements.next = document.getElementById('btn-next');
+    elements.done = document.getElementById('btn-done');
+    elements.sync = document.getElementById('btn-sync');
+    elements.export = document.getElementById('btn-export');
+    elements.message = document.getElementById('message');
+}
+
 // ===== STATE UPDATES =====
 
 function getCurrentTask() {
@@ -344,10 +538,10 @@ function getCurrentTask() {
 function updateTaskDisplay() {
     const task = getCurrentTask();
 
-    const titleEl = document.getElementById('task-title');
-    const descEl = document.getElementById('task-description');
-    const metaEl = document.getElementById('task-meta');
-    const timeEl = document.getElementById('task-time');
+    const titleEl = elements.title;
+    const descEl = elements.description;
+    const metaEl = elements.meta;
+    const timeEl = elements.time;
 
     if (!task) {
         titleEl.textContent = state.viewingDone ? 'No completed tasks' : 'No tasks available';
@@ -387,9 +581,9 @@ function updateTaskDisplay() {
 }
 
 function updateButtonStates() {
-    const toggleBtn = document.getElementById('btn-toggle');
-    const prevBtn = document.getElementById('btn-previous');
-    const nextBtn = document.getElementById('btn-next');
+    const toggleBtn = elements.toggle;
+    const prevBtn = elements.previous;
+    const nextBtn = elements.next;
 
     const currentTask = getCurrentTask();
     const isActive = currentTask && currentTask.id === state.activeTaskId;
@@ -398,7 +592,7 @@ function updateButtonStates() {
     toggleBtn.disabled = !currentTask;
 
     // Update toggle button icon and state
-    const icon = toggleBtn.querySelector('i');
+    const icon = elements.toggleIcon;
     if (isActive) {
         icon.className = 'fa-solid fa-pause';
         toggleBtn.classList.add('active');
@@ -495,56 +689,52 @@ function handleDone() {
 
 async function handleSync() {
     try {
-        await syncTasks();
+        await syncTasks(true);
         showMessage('Tasks synced from Todoist');
     } catch (error) {
         showMessage(error.message, 'error');
     }
 }
 
+// Characters that force a CSV field to be quoted
+const CSV_SPECIAL_CHARS = /[",\r\n]/;
+
+function escapeCsvField(value) {
+    return CSV_SPECIAL_CHARS.test(value) ? `"${value.replace(/"/g, '""')}"` : value;
+}
+
 async function handleExport() {
     try {
         // First sync to get the latest task data
         await syncTasks();
 
         // Build export data with task name, duration, and completion status
-        const exportData = [];
-        const processedTaskIds = new Set();
-
-        // Process all tasks (both incomplete and completed)
-        const allTasks = [...state.taskList, ...state.doneTaskList];
-
-        for (const task of allTasks) {
-            if (processedTaskIds.has(task.id)) continue;
-            processedTaskIds.add(task.id);
+        const now = nowSeconds();
 
-            const totalSeconds = Storage.getTotalTimeForTask(task.id);
-            const isComplete = task.is_completed || false;
-            const duration = formatTime(totalSeconds);
-
-            exportData.push({
+        // Process all tasks (both incomplete and completed) - the ID index holds each once
+        const exportData = Array.from(state.taskIndex.values(), task => {
+            const totalSeconds = Storage.getTotalTimeForTask(task.id, now);
+            return {
                 taskName: task.content || 'Unnamed task',
                 durationSeconds: totalSeconds,
-                durationFormatted: duration,
-                isComplete: isComplete ? 'Complete' : 'Incomplete'
-            });
-        }
+                durationFormatted: formatTime(totalSeconds),
+                isComplete: task.is_completed ? 'Complete' : 'Incomplete'
+            };
+        });
 
         // Sort by duration descending
         exportData.sort((a, b) => b.durationSeconds - a.durationSeconds);
 
         // Generate CSV
-        let csv = 'Task Name,Duration,Status\n';
+        const lines = ['Task Name,Duration,Status'];
         for (const row of exportData) {
-            // Escape task name if it contains commas or quotes
-            const escapedName = row.taskName.includes(',') || row.taskName.includes('"')
-                ? `"${row.taskName.replace(/"/g, '""')}"`
-                : row.taskName;
-            csv += `${escapedName},${row.durationFormatted},${row.isComplete}\n`;
+            // Only the task name is free text; duration and status never need escaping
+            lines.push(`${escapeCsvField(row.taskName)},${row.durationFormatted},${row.isComplete}`);
         }
+        lines.push('');
 
-        // Create download
-        const blob = new Blob([csv], { type: 'text/csv;charset=utf-8;' });
+        // Create download from the whole CSV in one piece
+        const blob = new Blob([lines.join('\n')], { type: 'text/csv;charset=utf-8;' });
         const url = URL.createObjectURL(blob);
         const link = document.createElement('a');
         link.setAttribute('href', url);
@@ -562,6 +752,11 @@ async function handleExport() {
 
 // ===== UTILITY FUNCTIONS =====
 
+// Current Unix time in whole seconds, the unit all time entries use
+function nowSeconds() {
+    return Math.floor(Date.now() / 1000);
+}
+
 function formatTime(seconds) {
     if (seconds === 0) return '0m';
 
@@ -578,7 +773,7 @@ function formatTime(seconds) {
 }
 
 function showMessage(message, type = 'success') {
-    const messageEl = document.getElementById('message');
+    const messageEl = elements.message;
     messageEl.textContent = message;
     messageEl.className = `message ${type} show`;
 
@@ -612,14 +807,27 @@ async function getApiToken() {
     throw new Error('API token required');
 }
 
-// ===== POLLING =====
+// ===== CROSS-TAB UPDATES =====
 
-async function pollActiveTask() {
-    // Just update local state - no server polling needed
-    updateActiveTaskState();
+function handleStorageChange(event) {
+    // Ignore sessionStorage changes from same-tab frames
+    if (event.storageArea !== localStorage) return;
 
-    // Poll every 20 seconds (since no timer display is shown)
-    setTimeout(pollActiveTask, 20000);
+    // Another tab changed localStorage - re-read on next access
+    Storage.invalidate(event.key);
+
+    // Reflect a timer started or stopped elsewhere right away
+    if (event.key === null || event.key === STORAGE_KEYS.ACTIVE) {
+        updateActiveTaskState();
+    }
+}
+
+function handlePageShow(event) {
+    // Storage events are not delivered while a page sits in the back/forward cache
+    if (event.persisted) {
+        Storage.invalidate();
+        updateActiveTaskState();
+    }
 }
 
 // ===== INITIALIZATION =====
@@ -646,25 +854,26 @@ async function initialize() {
         updateTaskDisplay();
         updateButtonStates();
 
-        // Start polling
-        pollActiveTask();
-
     } catch (error) {
         console.error('Initialization error:', error);
-        document.getElementById('task-title').textContent = 'Error';
-        document.getElementById('task-description').textContent = error.message;
+        elements.title.textContent = 'Error';
+        elements.description.textContent = error.message;
     }
 }
 
 // ===== EVENT LISTENERS =====
 
 document.addEventListener('DOMContentLoaded', () => {
-    document.getElementById('btn-previous').addEventListener('click', handlePrevious);
-    document.getElementById('btn-next').addEventListener('click', handleNext);
-    document.getElementById('btn-toggle').addEventListener('click', handleToggle);
-    document.getElementById('btn-done').addEventListener('click', handleDone);
-    document.getElementById('btn-sync').addEventListener('click', handleSync);
-    document.getElementById('btn-export').addEventListener('click', handleExport);
+    cacheElements();
+    window.addEventListener('storage', handleStorageChange);
+    window.addEventListener('pageshow', handlePageShow);
+
+    elements.previous.addEventListener('click', handlePrevious);
+    elements.next.addEventListener('click', handleNext);
+    elements.toggle.addEventListener('click', handleToggle);
+    elements.done.addEventListener('click', handleDone);
+    elements.sync.addEventListener('click', handleSync);
+    elements.export.addEventListener('click', handleExport);
 
     // Start initialization
     initialize();